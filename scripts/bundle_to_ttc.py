@@ -14,6 +14,8 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
 from pathlib import Path
 from typing import List
 
@@ -27,10 +29,38 @@ def safe_print(*args, **kwargs):
         pass
 
 
+# Metadata tables that are commonly identical across weights of one family
+SHAREABLE_TAGS = ("head", "hhea", "maxp", "name", "post")
+
+
+def share_identical_tables(fonts: List[TTFont]) -> None:
+    """Guarantee byte-identical metadata tables are stored once in the TTC.
+
+    The sfnt writer dedupes tables whose serialized data matches, but a
+    decompile/recompile cycle can perturb the bytes per font. Where the raw
+    reader data already matches across members, drop any decompiled copies
+    so every font streams the same bytes through the writer's table cache.
+    """
+    if len(fonts) < 2 or any(getattr(font, "reader", None) is None for font in fonts):
+        return
+    for tag in SHAREABLE_TAGS:
+        if not all(tag in font.reader.tables for font in fonts):
+            continue
+        try:
+            digests = {hashlib.sha1(font.reader[tag]).digest() for font in fonts}
+        except Exception:
+            continue
+        if len(digests) == 1:
+            for font in fonts:
+                font.tables.pop(tag, None)
+
+
 def load_fonts(paths: List[Path]) -> list[TTFont]:
     fonts: list[TTFont] = []
     for p in paths:
-        fonts.append(TTFont(str(p)))
+        # lazy=True keeps tables undecompiled until TTCollection.save needs
+        # them, so we don't hold every font fully expanded in memory at once
+        fonts.append(TTFont(str(p), lazy=True))
     return fonts
 
 
@@ -49,8 +79,19 @@ def main(argv: list[str] | None = None) -> int:
         safe_print(f"Source directory not found: {src_dir}")
         return 1
 
-    ttf_paths = sorted(src_dir.glob("*.ttf"))
-    otf_paths = sorted(src_dir.glob("*.otf")) if args.include_otf else []
+    # Single scandir pass instead of one glob per extension
+    ttf_paths: list[Path] = []
+    otf_paths: list[Path] = []
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".ttf"):
+                ttf_paths.append(Path(entry.path))
+            elif args.include_otf and entry.name.endswith(".otf"):
+                otf_paths.append(Path(entry.path))
+    ttf_paths.sort()
+    otf_paths.sort()
 
     if not ttf_paths and not otf_paths:
         safe_print(f"No fonts found in: {src_dir}")
@@ -64,11 +105,14 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     fonts = load_fonts(candidates)
+    share_identical_tables(fonts)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     # Create a new empty collection and assign fonts
     tc = TTCollection()
     tc.fonts = fonts
-    tc.save(str(out_path))
+    # Large buffer keeps the table-by-table serialization off tiny writes
+    with open(out_path, "wb", buffering=4 * 1024 * 1024) as out_file:
+        tc.save(out_file)
     safe_print("Wrote TTC:", out_path)
     return 0
 
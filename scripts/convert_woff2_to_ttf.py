@@ -12,6 +12,13 @@ Notes:
 """
 
 import argparse
+import bisect
+import concurrent.futures
+import functools
+import gc
+import hashlib
+import itertools
+import os
 import re
 import sys
 from pathlib import Path
@@ -21,15 +28,97 @@ from fontTools.ttLib import TTFont
 from fontTools.ttLib.ttCollection import TTCollection
 
 
+# Compiled once; these run for every font in the hot naming paths
+_RE_NON_WORD = re.compile(r'[^\w\s-]')
+_RE_WS = re.compile(r'\s+')
+_RE_NON_WORD_NO_WS = re.compile(r'[^\w-]')
+
+# usWeightClass buckets, presorted for bisect: a weight maps to the first
+# key that is >= its class value
+_WEIGHT_KEYS = [100, 200, 250, 300, 350, 400, 500, 600, 700, 800, 900, 950]
+_WEIGHT_NAMES = [
+    "Thin", "ExtraLight", "UltraLight", "Light", "SemiLight", "Regular",
+    "Medium", "SemiBold", "Bold", "ExtraBold", "Black", "ExtraBlack",
+]
+
+
 def determine_output_extension(font: TTFont) -> str:
     """Return ".otf" if CFF/CFF2 outlines present; otherwise ".ttf"."""
-    if "CFF " in font or "CFF2" in font:
+    # Consult the sfnt directory parsed at open time; membership on the
+    # TTFont itself can pull the table through the loader machinery
+    reader = getattr(font, 'reader', None)
+    tables = reader.tables if reader is not None else font
+    if "CFF " in tables or "CFF2" in tables:
         return ".otf"
     return ".ttf"
 
 
-def extract_font_metadata(font: TTFont) -> Dict[str, str]:
-    """Extract comprehensive font metadata for proper naming."""
+# Metadata tables commonly identical across the weights of one family
+_SHAREABLE_TAGS = ('head', 'hhea', 'maxp', 'name', 'post')
+
+
+def _share_identical_tables(fonts: List[TTFont]) -> None:
+    """Guarantee byte-identical metadata tables are stored once in the TTC.
+
+    Where the raw reader data already matches across members, drop any
+    decompiled copies so every font streams the same bytes through the sfnt
+    writer's table cache instead of recompiling per font.
+    """
+    if len(fonts) < 2 or any(getattr(font, 'reader', None) is None for font in fonts):
+        return
+    for tag in _SHAREABLE_TAGS:
+        if not all(tag in font.reader.tables for font in fonts):
+            continue
+        try:
+            digests = {hashlib.sha1(font.reader[tag]).digest() for font in fonts}
+        except Exception:
+            continue
+        if len(digests) == 1:
+            for font in fonts:
+                font.tables.pop(tag, None)
+
+
+def _index_name_records(name_table) -> Dict[int, List]:
+    """Index name records by nameID so lookups don't rescan the whole table."""
+    index: Dict[int, List] = {}
+    for record in name_table.names:
+        index.setdefault(record.nameID, []).append(record)
+    return index
+
+
+def _extract_features(font: TTFont) -> List[str]:
+    """Collect OpenType feature tags from GSUB/GPOS."""
+    features = set()
+    if 'GSUB' in font:
+        gsub = font['GSUB']
+        if hasattr(gsub.table, 'FeatureList') and gsub.table.FeatureList:
+            for feature_record in gsub.table.FeatureList.FeatureRecord:
+                features.add(feature_record.FeatureTag)
+
+    if 'GPOS' in font:
+        gpos = font['GPOS']
+        if hasattr(gpos.table, 'FeatureList') and gpos.table.FeatureList:
+            for feature_record in gpos.table.FeatureList.FeatureRecord:
+                features.add(feature_record.FeatureTag)
+
+    return list(features)
+
+
+def _annotate_features(metadata: Dict[str, str], features: List[str]) -> None:
+    """Record features plus the derived flags the naming code consumes, so
+    the feature list isn't re-traversed per filename."""
+    metadata['features'] = features
+    metadata['_has_dlig'] = 'dlig' in features
+    metadata['_ss_count'] = sum(1 for f in features if f.startswith('ss'))
+
+
+def extract_font_metadata(font: TTFont, want_features: bool = True) -> Dict[str, str]:
+    """Extract comprehensive font metadata for proper naming.
+
+    Set want_features=False to skip the GSUB/GPOS feature scan (their
+    decompile is expensive) when only names/weight/style are needed;
+    metadata['features'] is then None so callers can backfill it later.
+    """
     metadata = {
         'family': '',
         'subfamily': '',
@@ -37,45 +126,31 @@ def extract_font_metadata(font: TTFont) -> Dict[str, str]:
         'postscript_name': '',
         'weight': 'Regular',
         'style': 'Regular',
-        'features': []
+        'features': [],
+        '_has_dlig': False,
+        '_ss_count': 0
     }
     
     # Extract name table information
     if 'name' in font:
-        name_table = font['name']
-        for record in name_table.names:
-            try:
-                text = record.toUnicode()
-                if record.nameID == 1:  # Font Family name
-                    metadata['family'] = text
-                elif record.nameID == 2:  # Font Subfamily name
-                    metadata['subfamily'] = text
-                elif record.nameID == 4:  # Full font name
-                    metadata['full_name'] = text
-                elif record.nameID == 6:  # PostScript name
-                    metadata['postscript_name'] = text
-            except UnicodeDecodeError:
-                continue
+        name_index = _index_name_records(font['name'])
+        # nameID 1: Family, 2: Subfamily, 4: Full name, 6: PostScript name
+        for key, name_id in (('family', 1), ('subfamily', 2), ('full_name', 4), ('postscript_name', 6)):
+            for record in name_index.get(name_id, []):
+                try:
+                    metadata[key] = record.toUnicode()
+                    break
+                except UnicodeDecodeError:
+                    continue
     
     # Extract weight and style from OS/2 table
     if 'OS/2' in font:
         os2 = font['OS/2']
         weight_class = os2.usWeightClass
-        
-        # Weight mapping
-        weight_names = {
-            100: "Thin", 200: "ExtraLight", 250: "UltraLight", 300: "Light",
-            350: "SemiLight", 400: "Regular", 500: "Medium", 600: "SemiBold",
-            700: "Bold", 800: "ExtraBold", 900: "Black", 950: "ExtraBlack"
-        }
-        
+
         # Find closest weight name
-        for w in sorted(weight_names.keys()):
-            if weight_class <= w:
-                metadata['weight'] = weight_names[w]
-                break
-        else:
-            metadata['weight'] = f"W{weight_class}"
+        i = bisect.bisect_left(_WEIGHT_KEYS, weight_class)
+        metadata['weight'] = _WEIGHT_NAMES[i] if i < len(_WEIGHT_KEYS) else f"W{weight_class}"
         
         # Style flags from OS/2
         selection = os2.fsSelection
@@ -101,21 +176,39 @@ def extract_font_metadata(font: TTFont) -> Dict[str, str]:
         metadata['style'] = ' '.join(style_parts) if style_parts else 'Regular'
     
     # Extract OpenType features for ligature detection
-    features = set()
-    if 'GSUB' in font:
-        gsub = font['GSUB']
-        if hasattr(gsub.table, 'FeatureList') and gsub.table.FeatureList:
-            for feature_record in gsub.table.FeatureList.FeatureRecord:
-                features.add(feature_record.FeatureTag)
-    
-    if 'GPOS' in font:
-        gpos = font['GPOS']
-        if hasattr(gpos.table, 'FeatureList') and gpos.table.FeatureList:
-            for feature_record in gpos.table.FeatureList.FeatureRecord:
-                features.add(feature_record.FeatureTag)
-    
-    metadata['features'] = list(features)
-    
+    if want_features:
+        _annotate_features(metadata, _extract_features(font))
+    else:
+        metadata['features'] = None
+
+    return metadata
+
+
+def _load_once(path: Path, lazy: bool = True) -> Tuple[TTFont, Dict[str, str]]:
+    """Open a font a single time and return it with its extracted metadata.
+
+    Callers that need both the TTFont (extension check, save) and the
+    metadata should come through here rather than opening the file per use.
+    Only usable on in-process paths: TTFont objects don't pickle, so the
+    process-pool conversion path passes plain metadata dicts instead.
+    """
+    font = TTFont(str(path), lazy=lazy)
+    # Ensure downstream saves emit an unflavored sfnt
+    font.flavor = None
+    return font, extract_font_metadata(font)
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_for_path(path_str: str, size: int, mtime_ns: int, want_features: bool = True) -> Dict[str, str]:
+    """Extract metadata for a font file, cached by (path, size, mtime).
+
+    The stat fields key the cache so a re-listed but unchanged file never
+    gets re-parsed. Callers that mutate the result must copy it first.
+    """
+    font = TTFont(path_str, lazy=True)
+    metadata = extract_font_metadata(font, want_features=want_features)
+    # The parent's filename planning needs the output extension too
+    metadata['_ext'] = determine_output_extension(font)
     return metadata
 
 
@@ -124,8 +217,8 @@ def generate_output_filename(metadata: Dict[str, str], extension: str, force_fam
     family = force_family or metadata['family'] or 'Unknown'
     
     # Clean family name
-    family = re.sub(r'[^\w\s-]', '', family)
-    family = re.sub(r'\s+', '', family)  # Remove spaces
+    family = _RE_NON_WORD.sub('', family)
+    family = _RE_WS.sub('', family)  # Remove spaces
     
     # Build style suffix
     style_parts = []
@@ -140,12 +233,10 @@ def generate_output_filename(metadata: Dict[str, str], extension: str, force_fam
     
     # Special handling for ligatures and features
     special_features = []
-    if 'dlig' in metadata['features']:
+    if metadata.get('_has_dlig'):
         special_features.append('Ligatures')
-    if any(f.startswith('ss') for f in metadata['features']):
-        stylistic_sets = [f for f in metadata['features'] if f.startswith('ss')]
-        if len(stylistic_sets) > 3:  # Many stylistic sets suggest special variant
-            special_features.append('Stylistic')
+    if metadata.get('_ss_count', 0) > 3:  # Many stylistic sets suggest special variant
+        special_features.append('Stylistic')
     
     # Combine all parts
     filename_parts = [family]
@@ -160,106 +251,165 @@ def generate_output_filename(metadata: Dict[str, str], extension: str, force_fam
     if not force_family and (not family or family.lower() in ['unknown', 'regular', 'font']):
         ps_name = metadata['postscript_name']
         if ps_name:
-            ps_name = re.sub(r'[^\w-]', '', ps_name)
+            ps_name = _RE_NON_WORD_NO_WS.sub('', ps_name)
             filename = ps_name + extension
     
     return filename
 
 
-def rename_font_family(font: TTFont, new_family_name: str) -> None:
-    """Rename the font family in the font's name table."""
+def rename_font_family(font: TTFont, new_family_name: str, name_index: Dict[int, List] = None) -> None:
+    """Rename the font family in the font's name table.
+
+    Pass `name_index` (from _index_name_records) to reuse an index built by a
+    previous lookup instead of rescanning the record list.
+    """
     if 'name' not in font:
         return
-    
-    name_table = font['name']
-    
+
+    if name_index is None:
+        name_index = _index_name_records(font['name'])
+
+    # Idempotent re-runs: if every family record already carries the target
+    # name the font was renamed before, so skip all the re-encoding work
+    family_records = name_index.get(1, [])
+    if family_records:
+        try:
+            if all(record.toUnicode() == new_family_name for record in family_records):
+                return
+        except UnicodeDecodeError:
+            pass
+
     # Update relevant name records
-    for record in name_table.names:
+    for record in family_records:  # Font Family name
         try:
-            if record.nameID == 1:  # Font Family name
-                record.string = new_family_name.encode('utf-16be') if record.isUnicode() else new_family_name.encode('latin-1')
-            elif record.nameID == 4:  # Full font name
-                # Extract style from existing full name and combine with new family
-                old_full = record.toUnicode()
-                # Try to extract style portion (everything after the first space or dash)
-                style_part = ""
-                for sep in [' ', '-']:
-                    if sep in old_full:
-                        parts = old_full.split(sep, 1)
-                        if len(parts) > 1:
-                            style_part = parts[1]
-                            break
-                
-                new_full = new_family_name
-                if style_part:
-                    new_full += f" {style_part}"
-                
-                record.string = new_full.encode('utf-16be') if record.isUnicode() else new_full.encode('latin-1')
-            elif record.nameID == 6:  # PostScript name
-                # Create PostScript name by removing spaces and adding style
-                ps_base = new_family_name.replace(' ', '')
-                old_ps = record.toUnicode()
-                
-                # Try to extract style suffix from old PostScript name
-                style_suffix = ""
-                if '-' in old_ps:
-                    style_suffix = old_ps.split('-', 1)[1]
-                
-                new_ps = ps_base
-                if style_suffix:
-                    new_ps += f"-{style_suffix}"
-                
-                record.string = new_ps.encode('utf-16be') if record.isUnicode() else new_ps.encode('latin-1')
+            record.string = new_family_name.encode('utf-16be') if record.isUnicode() else new_family_name.encode('latin-1')
+        except (UnicodeDecodeError, UnicodeEncodeError, AttributeError):
+            continue
+
+    for record in name_index.get(4, []):  # Full font name
+        try:
+            # Extract style from existing full name and combine with new family
+            old_full = record.toUnicode()
+            # Try to extract style portion (everything after the first space or dash)
+            style_part = ""
+            for sep in [' ', '-']:
+                if sep in old_full:
+                    parts = old_full.split(sep, 1)
+                    if len(parts) > 1:
+                        style_part = parts[1]
+                        break
+
+            new_full = new_family_name
+            if style_part:
+                new_full += f" {style_part}"
+
+            record.string = new_full.encode('utf-16be') if record.isUnicode() else new_full.encode('latin-1')
         except (UnicodeDecodeError, UnicodeEncodeError, AttributeError):
             continue
 
+    for record in name_index.get(6, []):  # PostScript name
+        try:
+            # Create PostScript name by removing spaces and adding style
+            ps_base = new_family_name.replace(' ', '')
+            old_ps = record.toUnicode()
+
+            # Try to extract style suffix from old PostScript name
+            style_suffix = ""
+            if '-' in old_ps:
+                style_suffix = old_ps.split('-', 1)[1]
 
-def convert_single_file(src_path: Path, out_dir: Path, overwrite: bool, use_metadata_names: bool = True, force_family: str = None) -> Tuple[bool, str, Path]:
+            new_ps = ps_base
+            if style_suffix:
+                new_ps += f"-{style_suffix}"
+
+            record.string = new_ps.encode('utf-16be') if record.isUnicode() else new_ps.encode('latin-1')
+        except (UnicodeDecodeError, UnicodeEncodeError, AttributeError):
+            continue
+
+
+def convert_single_file(src_path: Path, out_dir: Path, overwrite: bool, use_metadata_names: bool = True, force_family: str = None, metadata: Dict[str, str] = None, out_filename: str = None) -> Tuple[bool, str, Path]:
     """Convert one .woff2 file to TTF/OTF.
 
+    Pass `metadata` (from a prior extract_font_metadata on the same file) to
+    skip re-extracting it here. `out_filename` is the destination name the
+    parent resolved and deduped before submission; when given it is used
+    verbatim so pool workers never derive (and race on) the same path.
+
     Returns (success, message, output_path).
     """
     try:
-        # Load WOFF2; requires brotli to be installed
-        font = TTFont(str(src_path))
+        # Hash-based names depend only on the source stem, so a re-run can
+        # skip the brotli decode entirely when an output already exists
+        if not use_metadata_names and not overwrite:
+            for candidate_ext in ('.ttf', '.otf'):
+                candidate = out_dir / (src_path.stem + candidate_ext)
+                if candidate.exists():
+                    return (
+                        False,
+                        f"Skip (exists): {candidate}",
+                        candidate,
+                    )
+
+        # Load WOFF2; requires brotli to be installed. lazy=True defers table
+        # decompilation so untouched tables (glyf etc.) pass through on save.
+        font = TTFont(str(src_path), lazy=True)
         # Ensure we save as an unflavored sfnt (TTF/OTF)
         font.flavor = None
         ext = determine_output_extension(font)
 
-        # Extract metadata first for potential family renaming
-        metadata = extract_font_metadata(font)
-        
-        # Rename font family if requested
-        if force_family:
-            rename_font_family(font, force_family)
-            # Update metadata to reflect the new family name
-            metadata['family'] = force_family
-
-        if use_metadata_names:
-            # Generate proper filename using metadata
-            out_filename = generate_output_filename(metadata, ext, force_family)
-            
-            # Fallback to original name if metadata extraction fails
-            if not out_filename or out_filename == ext:
-                out_filename = src_path.stem + ext
-        else:
+        if not use_metadata_names:
             out_filename = src_path.stem + ext
-            
-        out_path = out_dir / out_filename
-
-        if out_path.exists() and not overwrite:
-            return (
-                False,
-                f"Skip (exists): {out_path}",
-                out_path,
-            )
+            out_path = out_dir / out_filename
+            # Rename still applies in hash-name mode; only the filename
+            # strategy differs
+            if force_family:
+                rename_font_family(font, force_family)
+            metadata = None
+        else:
+            # Extract metadata first for potential family renaming
+            if metadata is None:
+                metadata = extract_font_metadata(font)
+            elif metadata.get('features') is None:
+                # Grouping pass skipped the feature scan; fill it in here
+                _annotate_features(metadata, _extract_features(font))
+
+            # Rename font family if requested
+            if force_family:
+                rename_font_family(font, force_family)
+                # Update metadata to reflect the new family name
+                metadata['family'] = force_family
+
+            # Generate the filename only when the parent's planning pass had
+            # no metadata for this font (it then couldn't be deduped either,
+            # but such fonts fail to parse before anything is written)
+            if out_filename is None:
+                out_filename = generate_output_filename(metadata, ext, force_family)
+                # Fallback to original name if metadata extraction fails
+                if not out_filename or out_filename == ext:
+                    out_filename = src_path.stem + ext
+
+            out_path = out_dir / out_filename
+
+            if out_path.exists() and not overwrite:
+                return (
+                    False,
+                    f"Skip (exists): {out_path}",
+                    out_path,
+                )
 
         out_dir.mkdir(parents=True, exist_ok=True)
-        font.save(str(out_path))
-        
-        # Enhanced reporting with metadata
+        # Save through a large buffered writer so fontTools streams tables
+        # out instead of issuing many small writes
+        with open(out_path, 'wb', buffering=1024 * 1024) as out_file:
+            font.save(out_file)
+
+        # Release the font before building the report so peak RSS isn't
+        # held through the string work (multiplied by pool workers)
+        font.close()
+        del font
+
+        # Enhanced reporting with the metadata extracted above
         if use_metadata_names:
-            metadata = extract_font_metadata(font)
             family = metadata.get('family', 'Unknown')
             style_info = f"{metadata.get('weight', 'Regular')} {metadata.get('style', 'Regular')}".strip()
             feature_count = len(metadata.get('features', []))
@@ -298,7 +448,9 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Source directory not found: {src_dir}")
         return 1
 
-    woff2_files = sorted(src_dir.glob("*.woff2"))
+    # os.scandir avoids glob's per-entry Path/stat machinery on big directories
+    with os.scandir(src_dir) as entries:
+        woff2_files = sorted(Path(entry.path) for entry in entries if entry.is_file() and entry.name.endswith(".woff2"))
     if not woff2_files:
         print(f"No .woff2 files found in: {src_dir}")
         return 1
@@ -315,15 +467,16 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.dry_run:
         print("\n=== DRY RUN - No files will be written ===")
+        # Batch output: per-line print acquires the stdout lock and issues a
+        # small write for every font, which dominates on large directories
+        lines: list[str] = []
         for path in woff2_files:
             try:
-                font = TTFont(str(path))
-                font.flavor = None
+                # One open serves the extension check and the metadata
+                font, metadata = _load_once(path)
                 ext = determine_output_extension(font)
-                
+
                 if use_metadata_names:
-                    metadata = extract_font_metadata(font)
-                    
                     # Apply force family if specified
                     display_family = args.force_family or metadata.get('family', 'Unknown')
                     if args.force_family:
@@ -337,9 +490,9 @@ def main(argv: list[str] | None = None) -> int:
                     feature_info = ""
                     
                     special_features = []
-                    if 'dlig' in metadata.get('features', []):
+                    if metadata.get('_has_dlig'):
                         special_features.append('ligatures')
-                    if any(f.startswith('ss') for f in metadata.get('features', [])):
+                    if metadata.get('_ss_count', 0) > 0:
                         special_features.append('stylistic sets')
                     if special_features:
                         feature_info = f" (with {', '.join(special_features)})"
@@ -347,57 +500,136 @@ def main(argv: list[str] | None = None) -> int:
                     if args.organize_by_family:
                         out_filename = f"{display_family}/{out_filename}"
                     
-                    print(f"Would convert: {path.name} -> {out_filename}")
-                    print(f"   Font: {display_family} {style_info}{feature_info}")
+                    lines.append(f"Would convert: {path.name} -> {out_filename}\n")
+                    lines.append(f"   Font: {display_family} {style_info}{feature_info}\n")
                 else:
                     out_filename = path.stem + ext
-                    print(f"Would convert: {path.name} -> {out_filename}")
-                    
+                    lines.append(f"Would convert: {path.name} -> {out_filename}\n")
+
             except Exception as exc:  # noqa: BLE001
-                print(f"Would fail: {path.name} ({exc})")
+                lines.append(f"Would fail: {path.name} ({exc})\n")
+
+            if len(lines) >= 256:
+                sys.stdout.writelines(lines)
+                lines.clear()
+        sys.stdout.writelines(lines)
+        _metadata_for_path.cache_clear()
         return 0
 
-    # Group fonts by family if requested
+    # Group fonts by family if requested. The metadata extracted here is kept
+    # alongside each path so the conversion pass doesn't re-extract it.
     font_groups = {}
     if args.organize_by_family:
         target_family = args.force_family or "Unknown"
         for path in woff2_files:
             try:
-                font = TTFont(str(path))
-                metadata = extract_font_metadata(font)
+                st = path.stat()
+                # Only the family name matters for grouping
+                metadata = _metadata_for_path(str(path), st.st_size, st.st_mtime_ns, want_features=False)
                 family = args.force_family or metadata.get('family', 'Unknown')
-                family = re.sub(r'[^\w\s-]', '', family)
-                family = re.sub(r'\s+', '', family) or 'Unknown'
-                
+                family = _RE_NON_WORD.sub('', family)
+                family = _RE_WS.sub('', family) or 'Unknown'
+
                 if family not in font_groups:
                     font_groups[family] = []
-                font_groups[family].append(path)
+                font_groups[family].append((path, metadata))
             except Exception:
                 if target_family not in font_groups:
                     font_groups[target_family] = []
-                font_groups[target_family].append(path)
+                font_groups[target_family].append((path, None))
     else:
-        font_groups[''] = woff2_files
+        font_groups[''] = [(path, None) for path in woff2_files]
 
     success_count = 0
     fail_count = 0
-    converted_fonts = []
+    # Preallocate to the known upper bound; index-assignment avoids the
+    # geometric list regrowth append incurs on thousands of files
+    converted_fonts = [None] * len(woff2_files)
+    converted_count = 0
     
-    for family_name, paths in font_groups.items():
-        if args.organize_by_family and family_name:
-            family_out_dir = out_dir / family_name
-            print(f"\n=== Processing {family_name} family ===")
-        else:
-            family_out_dir = out_dir
-            
-        for path in paths:
-            ok, message, converted_path = convert_single_file(path, family_out_dir, args.overwrite, use_metadata_names, args.force_family)
-            print(message)
-            if ok:
-                success_count += 1
-                converted_fonts.append(converted_path)
+    # Each file is an independent brotli-decompress + sfnt re-serialize, so
+    # conversions run in a process pool to use all cores (threads would
+    # serialize on the GIL in fontTools' compile path).
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for family_name, entries in font_groups.items():
+            if args.organize_by_family and family_name:
+                family_out_dir = out_dir / family_name
+                print(f"\n=== Processing {family_name} family ===")
             else:
-                fail_count += 1
+                family_out_dir = out_dir
+
+            if use_metadata_names:
+                # Resolve destination filenames in the parent and dedupe
+                # before submission: two sources with the same metadata-
+                # derived name (or any two same-style fonts under
+                # --force-family) would otherwise race two workers onto one
+                # output file. Mirrors the organize script's copy-plan dedupe.
+                plan = {}  # dst_path -> (src_path, metadata, out_filename)
+                unplanned = []  # metadata unavailable; the worker reports the error
+                dup_msgs: list[str] = []
+                for path, metadata in entries:
+                    if metadata is None:
+                        try:
+                            st = path.stat()
+                            metadata = _metadata_for_path(str(path), st.st_size, st.st_mtime_ns, want_features=False)
+                        except Exception:  # noqa: BLE001
+                            unplanned.append((path, None, None))
+                            continue
+                    ext = metadata.get('_ext') or '.ttf'
+                    out_filename = generate_output_filename(metadata, ext, args.force_family)
+                    if not out_filename or out_filename == ext:
+                        out_filename = path.stem + ext
+                    dst = family_out_dir / out_filename
+                    if dst in plan:
+                        # Match the serial loop: without --overwrite the
+                        # first writer wins and later ones skip; with it the
+                        # last write is the one that lands
+                        if args.overwrite:
+                            dup_msgs.append(f"Skip (duplicate destination): {plan[dst][0].name} -> {out_filename}\n")
+                            plan[dst] = (path, metadata, out_filename)
+                        else:
+                            dup_msgs.append(f"Skip (duplicate destination): {path.name} -> {out_filename}\n")
+                        continue
+                    plan[dst] = (path, metadata, out_filename)
+                fail_count += len(dup_msgs)
+                sys.stdout.writelines(dup_msgs)
+                planned = list(plan.values()) + unplanned
+                paths = [path for path, _, _ in planned]
+                metadatas = [metadata for _, metadata, _ in planned]
+                out_filenames = [out_filename for _, _, out_filename in planned]
+            else:
+                # Hash names derive from the unique source stems, so
+                # destinations cannot collide
+                paths = [path for path, _ in entries]
+                metadatas = [metadata for _, metadata in entries]
+                out_filenames = itertools.repeat(None)
+            # executor.map keeps results in input order
+            messages: list[str] = []
+            for ok, message, converted_path in executor.map(
+                convert_single_file,
+                paths,
+                itertools.repeat(family_out_dir),
+                itertools.repeat(args.overwrite),
+                itertools.repeat(use_metadata_names),
+                itertools.repeat(args.force_family),
+                metadatas,
+                out_filenames,
+            ):
+                messages.append(message + "\n")
+                if len(messages) >= 256:
+                    sys.stdout.writelines(messages)
+                    messages.clear()
+                if ok:
+                    success_count += 1
+                    converted_fonts[converted_count] = converted_path
+                    converted_count += 1
+                else:
+                    fail_count += 1
+                if (success_count + fail_count) % 32 == 0:
+                    gc.collect()
+            sys.stdout.writelines(messages)
+
+    del converted_fonts[converted_count:]
 
     print("")
     print(f"Done. Success: {success_count}, Failed/Skipped: {fail_count}")
@@ -410,31 +642,39 @@ def main(argv: list[str] | None = None) -> int:
         try:
             # Determine collection filename
             collection_name = args.force_family or "FontCollection"
-            collection_name = re.sub(r'[^\w\s-]', '', collection_name)
-            collection_name = re.sub(r'\s+', '', collection_name)
+            collection_name = _RE_NON_WORD.sub('', collection_name)
+            collection_name = _RE_WS.sub('', collection_name)
             collection_path = out_dir / f"{collection_name}.ttc"
             
             print(f"\n=== Creating font collection ===")
             print(f"Collection: {collection_path}")
             print(f"Including {len(converted_fonts)} font(s)")
             
-            # Load all converted fonts
-            fonts = []
+            # Load all converted fonts (preallocated; every slot normally fills)
+            fonts = [None] * len(converted_fonts)
+            font_count = 0
             for font_path in converted_fonts:
                 try:
-                    fonts.append(TTFont(str(font_path)))
+                    # lazy=True caps peak memory; tables are decompiled on
+                    # demand during collection.save
+                    fonts[font_count] = TTFont(str(font_path), lazy=True)
+                    font_count += 1
                 except Exception as e:
                     print(f"Warning: Could not load {font_path.name} for collection: {e}")
-            
+            del fonts[font_count:]
+
             if fonts:
-                # Create collection
+                # Create collection, sharing tables that are identical
+                # across members
+                _share_identical_tables(fonts)
                 collection = TTCollection()
                 collection.fonts = fonts
                 
                 if collection_path.exists() and not args.overwrite:
                     print(f"Collection exists, use --overwrite to replace: {collection_path}")
                 else:
-                    collection.save(str(collection_path))
+                    with open(collection_path, 'wb', buffering=4 * 1024 * 1024) as collection_file:
+                        collection.save(collection_file)
                     print(f"Created font collection: {collection_path}")
                     print(f"Size: {collection_path.stat().st_size / 1024 / 1024:.1f} MB")
             else:
@@ -444,6 +684,7 @@ def main(argv: list[str] | None = None) -> int:
             print(f"Failed to create font collection: {e}")
             return 2
     
+    _metadata_for_path.cache_clear()
     return 0 if fail_count == 0 else 2
 
 
@@ -5,17 +5,37 @@ Downloads, converts, and organizes all  fonts with proper family mapping.
 """
 
 import argparse
+import asyncio
 import concurrent.futures
+import hashlib
+import itertools
 import json
+import logging
+import os
+import queue
 import shutil
 import subprocess
 import sys
+import threading
 import urllib.request
 import urllib.error
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import time
 
+try:
+    # Optional: reuses keep-alive connections + TLS sessions across downloads
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    # Optional: event-loop downloads avoid a thread + stack per in-flight
+    # socket and allow much higher concurrency than the thread pool
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 from fontTools.ttLib import TTFont
 from fontTools.ttLib.ttCollection import TTCollection
 
@@ -142,183 +162,548 @@ FONT_MAPPING = {
 }
 
 
+# Metadata tables that are commonly identical across weights of one family
+_SHAREABLE_TAGS = ("head", "hhea", "maxp", "name", "post")
+
+
+def _share_identical_tables(fonts: List[TTFont]) -> None:
+    """Let the TTC writer store byte-identical metadata tables once.
+
+    The sfnt writer dedupes tables whose serialized bytes match, but a
+    decompile/recompile cycle can perturb them per font. Where the raw
+    reader data matches across members, drop the decompiled copies so the
+    same bytes stream through the writer's table cache. Tables we edited
+    in memory (e.g. renamed name records) are left alone.
+    """
+    if len(fonts) < 2 or any(getattr(font, "reader", None) is None for font in fonts):
+        return
+    for tag in _SHAREABLE_TAGS:
+        # rename_font_family edits name in memory; the reader still holds the
+        # pre-rename bytes, so never swap a decompiled name for raw data
+        if tag == "name" and any(tag in font.tables for font in fonts):
+            continue
+        if not all(tag in font.reader.tables for font in fonts):
+            continue
+        try:
+            digests = {hashlib.sha1(font.reader[tag]).digest() for font in fonts}
+        except Exception:
+            continue
+        if len(digests) == 1:
+            for font in fonts:
+                font.tables.pop(tag, None)
+
+
+# (weight, style) -> subfamily name; one dict probe instead of branch chains
+_SUBFAMILY = {
+    (100, "normal"): "Thin",
+    (100, "italic"): "ThinItalic",
+    (300, "normal"): "Light",
+    (300, "italic"): "LightItalic",
+    (400, "normal"): "Regular",
+    (400, "italic"): "Italic",
+    (700, "normal"): "Bold",
+    (700, "italic"): "BoldItalic",
+    (900, "normal"): "Black",
+    (900, "italic"): "BlackItalic",
+}
+
+
+_LOG = logging.getLogger("fontmgr")
+
+# Emoji markers kept from the old print-based logger
+_LOG_PREFIX = {"INFO": "ℹ️", "ERROR": "❌", "SUCCESS": "✅", "DOWNLOAD": "📥", "CONVERT": "🔄"}
+
+
+# Streaming copy buffer for downloads; large enough to keep syscall count
+# low without holding meaningful memory per in-flight file
+_DOWNLOAD_CHUNK = 256 * 1024
+
+
+def _advise_sequential(fileobj) -> None:
+    """Hint the kernel we stream this file front to back (no-op elsewhere)."""
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+
+
+def _rename_font_family(font: TTFont, family_name: str, subfamily: str) -> None:
+    """Update font metadata with new family and subfamily names."""
+    if 'name' not in font:
+        return
+
+    name_table = font['name']
+
+    full_name = f"{family_name} {subfamily}"
+    ps_name = family_name.replace(' ', '') + '-' + subfamily.replace(' ', '')
+
+    # setName replaces or creates the canonical Windows and Mac records
+    # directly instead of scanning every record per name ID
+    for name_id, value in ((1, family_name), (2, subfamily), (4, full_name), (6, ps_name)):
+        name_table.setName(value, name_id, 3, 1, 0x409)  # Windows, en-US
+        name_table.setName(value, name_id, 1, 0, 0)  # Mac, Roman, English
+
+
+def _convert_font_worker(font_path_str: str, font_info: Dict, output_dir_str: str) -> Optional[Path]:
+    """Process-pool entry point: convert one font, return the written path.
+
+    Runs in a worker process, so it only takes and returns picklable values;
+    the TTFont object lives and dies inside the worker.
+    """
+    try:
+        font = TTFont(font_path_str, lazy=True, recalcBBoxes=False, recalcTimestamp=False)
+        font.flavor = None
+
+        tables = font.reader.tables if font.reader is not None else font
+        ext = ".otf"if "CFF "in tables or "CFF2"in tables else ".ttf"
+
+        subfamily = _SUBFAMILY.get((font_info['weight'], font_info['style']), "Regular")
+
+        # Family directories are pre-created by the caller
+        output_path = Path(output_dir_str) / font_info['family'] / (font_info['output_name'] + ext)
+
+        _rename_font_family(font, font_info['family'], subfamily)
+        font.save(str(output_path))
+        return output_path
+    except Exception:
+        return None
+
+
+class _AdaptiveSemaphore:
+    """Concurrency limiter that tunes itself to the link instead of a fixed N.
+
+    Starts narrow, adds a permit whenever aggregate throughput over the last
+    window grew by more than 10%, and gives one back on errors/timeouts.
+    The configured worker count stays as the hard ceiling.
+    """
+
+    def __init__(self, start: int, maximum: int, window: float = 2.0):
+        self.maximum = max(1, maximum)
+        self.limit = max(1, min(start, self.maximum))
+        self.window = window
+        self._sem = asyncio.Semaphore(self.limit)
+        self._bytes = 0
+        self._last_rate = 0.0
+        self._window_start = time.monotonic()
+        self._deficit = 0  # permits to swallow when shrinking
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._deficit > 0:
+            # Swallow this permit instead of releasing it
+            self._deficit -= 1
+        else:
+            self._sem.release()
+        return False
+
+    def record(self, nbytes: int) -> None:
+        """Account downloaded bytes; widen the limit if throughput is rising."""
+        self._bytes += nbytes
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return
+        rate = self._bytes / elapsed
+        if rate > self._last_rate * 1.1 and self.limit < self.maximum:
+            self.limit += 1
+            self._sem.release()  # grant one extra permit
+        self._last_rate = rate
+        self._bytes = 0
+        self._window_start = now
+
+    def shrink(self) -> None:
+        """Back off by one permit (error or timeout observed)."""
+        if self.limit > 1:
+            self.limit -= 1
+            self._deficit += 1
+
+
 class FontProcessor:
     """Handles font processing operations."""
     
-    def __init__(self, base_url: str, downloads_dir: Path, output_dir: Path, verbose: bool = False):
+    def __init__(self, base_url: str, downloads_dir: Path, output_dir: Path, verbose: bool = False, max_workers: int = 4, collection_only: bool = False):
         self.base_url = base_url
         self.downloads_dir = downloads_dir
         self.output_dir = output_dir
         self.verbose = verbose
-        
+        self.max_workers = max_workers
+        # When set, individual .ttf/.otf files are never written: converted
+        # fonts stay in memory and only the family .ttc files hit disk
+        self.collection_only = collection_only
+
+        # Console logger matching the old print format; --verbose unlocks
+        # the DEBUG-level download/convert chatter
+        if not _LOG.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+            _LOG.addHandler(handler)
+            _LOG.propagate = False
+        _LOG.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+        # One pooled session shared by all download threads: every font comes
+        # from the same host, so connection + TLS reuse saves a handshake per
+        # file. Falls back to plain urllib when urllib3 isn't installed.
+        if urllib3 is not None:
+            self._http = urllib3.PoolManager(
+                maxsize=max_workers,
+                block=True,
+                retries=urllib3.Retry(3, backoff_factor=0.3),
+            )
+        else:
+            self._http = None
+
         # Ensure directories exist
         self.downloads_dir.mkdir(exist_ok=True)
         self.output_dir.mkdir(exist_ok=True)
+
+        # Cached HTTP validators (ETag/Last-Modified) per filename, so reruns
+        # can revalidate existing files with a conditional GET instead of
+        # either re-downloading or trusting a stale copy blindly
+        self._etag_cache_path = self.downloads_dir / ".etag_cache.json"
+        self._etag_lock = threading.Lock()
+        try:
+            self._etag_cache = json.loads(self._etag_cache_path.read_text())
+        except Exception:
+            self._etag_cache = {}
+
+    def _conditional_headers(self, filename: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the cache."""
+        entry = self._etag_cache.get(filename)
+        headers: Dict[str, str] = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _store_validators(self, filename: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        if not etag and not last_modified:
+            return
+        with self._etag_lock:
+            self._etag_cache[filename] = {'etag': etag, 'last_modified': last_modified}
+
+    def _save_etag_cache(self) -> None:
+        try:
+            with self._etag_lock:
+                self._etag_cache_path.write_text(json.dumps(self._etag_cache, indent=2))
+        except Exception:
+            pass
     
-    def log(self, message: str, level: str = "INFO"):
-        """Log message with timestamp."""
-        if self.verbose or level in ["ERROR", "SUCCESS"]:
-            timestamp = time.strftime("%H:%M:%S")
-            prefix = {"INFO": "ℹ️", "ERROR": "❌", "SUCCESS": "✅", "DOWNLOAD": "📥", "CONVERT": "🔄"}
-            print(f"[{timestamp}] {prefix.get(level, '•')} {message}")
+    def log(self, message: str, level: str = "INFO", *args):
+        """Log message with timestamp.
+
+        Positional args are deferred %-style: suppressed levels skip the
+        string formatting entirely instead of building messages to drop.
+        """
+        if level == "ERROR":
+            method = _LOG.error
+        elif level == "SUCCESS":
+            method = _LOG.info
+        else:
+            # INFO/DOWNLOAD/CONVERT chatter only shows up under --verbose
+            method = _LOG.debug
+        method(_LOG_PREFIX.get(level, '•') + " " + message, *args)
     
     def download_font(self, filename: str, font_info: Dict) -> Tuple[bool, Optional[Path]]:
         """Download a single font file."""
         url = self.base_url.rstrip('/') + '/marketing-static/_next/static/media/' + filename
         local_path = self.downloads_dir / filename
-        
-        if local_path.exists():
-            self.log(f"Already exists: {filename}")
+
+        headers = self._conditional_headers(filename) if local_path.exists() else {}
+        if local_path.exists() and not headers:
+            # No validators to revalidate against; trust the local copy
+            self.log("Already exists: %s", "INFO", filename)
             return True, local_path
-        
+
         try:
-            self.log(f"Downloading: {font_info['description']}", "DOWNLOAD")
-            urllib.request.urlretrieve(url, str(local_path))
+            if headers:
+                self.log("Revalidating: %s", "DOWNLOAD", filename)
+            else:
+                self.log("Downloading: %s", "DOWNLOAD", font_info['description'])
+            if self._http is not None:
+                response = self._http.request('GET', url, headers=headers or None, preload_content=False)
+                try:
+                    if response.status == 304:
+                        self.log("Not modified: %s", "INFO", filename)
+                        return True, local_path
+                    if response.status >= 400:
+                        raise urllib.error.URLError(f"HTTP {response.status}")
+                    with open(local_path, 'wb') as out_file:
+                        _advise_sequential(out_file)
+                        shutil.copyfileobj(response, out_file, length=_DOWNLOAD_CHUNK)
+                    self._store_validators(filename, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                finally:
+                    response.release_conn()
+            else:
+                request = urllib.request.Request(url, headers=headers)
+                try:
+                    with urllib.request.urlopen(request) as response:
+                        with open(local_path, 'wb') as out_file:
+                            _advise_sequential(out_file)
+                            shutil.copyfileobj(response, out_file, length=_DOWNLOAD_CHUNK)
+                        self._store_validators(filename, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                except urllib.error.HTTPError as e:
+                    if e.code == 304:
+                        self.log("Not modified: %s", "INFO", filename)
+                        return True, local_path
+                    raise
             return True, local_path
-        except urllib.error.URLError as e:
-            self.log(f"Failed to download {filename}: {e}", "ERROR")
+        except Exception as e:
+            self.log("Failed to download %s: %s", "ERROR", filename, e)
             return False, None
     
-    def download_all_fonts(self, max_workers: int = 4) -> List[Tuple[Path, Dict]]:
-        """Download all fonts concurrently."""
-        self.log(f"Starting download of {len(FONT_MAPPING)} fonts...")
-        
+    async def _fetch(self, session, sem, filename: str, font_info: Dict, on_complete=None) -> Optional[Tuple[Path, Dict]]:
+        """Download one font inside the shared session, bounded by sem."""
+        url = self.base_url.rstrip('/') + '/marketing-static/_next/static/media/' + filename
+        local_path = self.downloads_dir / filename
+
+        headers = self._conditional_headers(filename) if local_path.exists() else {}
+        if local_path.exists() and not headers:
+            # No validators to revalidate against; trust the local copy
+            self.log("Already exists: %s", "INFO", filename)
+            if on_complete is not None:
+                on_complete((local_path, font_info))
+            return local_path, font_info
+
+        async with sem:
+            try:
+                if headers:
+                    self.log("Revalidating: %s", "DOWNLOAD", filename)
+                else:
+                    self.log("Downloading: %s", "DOWNLOAD", font_info['description'])
+                async with session.get(url, headers=headers or None) as response:
+                    if response.status == 304:
+                        self.log("Not modified: %s", "INFO", filename)
+                        if on_complete is not None:
+                            on_complete((local_path, font_info))
+                        return local_path, font_info
+                    response.raise_for_status()
+                    with open(local_path, 'wb') as out_file:
+                        _advise_sequential(out_file)
+                        async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK):
+                            out_file.write(chunk)
+                            sem.record(len(chunk))
+                    self._store_validators(filename, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                if on_complete is not None:
+                    on_complete((local_path, font_info))
+                return local_path, font_info
+            except Exception as e:
+                sem.shrink()
+                self.log("Failed to download %s: %s", "ERROR", filename, e)
+                return None
+
+    async def _download_all_async(self, max_workers: int, on_complete=None) -> List[Tuple[Path, Dict]]:
+        """Fetch every font over one keep-alive session with bounded concurrency."""
+        sem = _AdaptiveSemaphore(start=4, maximum=max_workers)
+        connector = aiohttp.TCPConnector(limit=max_workers, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(self._fetch(session, sem, filename, font_info, on_complete) for filename, font_info in FONT_MAPPING.items()),
+                return_exceptions=True,
+            )
+        self.log("Steady-state download concurrency: %d", "INFO", sem.limit)
+        return [result for result in results if isinstance(result, tuple)]
+
+    def download_all_fonts(self, max_workers: int = 4, on_complete=None) -> List[Tuple[Path, Dict]]:
+        """Download all fonts concurrently.
+
+        `on_complete` is called with (path, font_info) as each file lands,
+        which lets a consumer start work before the whole batch finishes.
+        """
+        self.log("Starting download of %d fonts...", "INFO", len(FONT_MAPPING))
+
+        if aiohttp is not None:
+            downloaded_fonts = asyncio.run(self._download_all_async(max_workers, on_complete))
+            self._save_etag_cache()
+            self.log("Downloaded %d/%d fonts", "SUCCESS", len(downloaded_fonts), len(FONT_MAPPING))
+            return downloaded_fonts
+
+        # Fallback: thread pool over the pooled/blocking HTTP path.
+        # executor.map keeps inputs and results aligned without the
+        # future-to-key dict; download_font already swallows its own errors.
         downloaded_fonts = []
-        
+        filenames = list(FONT_MAPPING)
+        infos = [FONT_MAPPING[filename] for filename in filenames]
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all download tasks
-            future_to_font = {
-                executor.submit(self.download_font, filename, font_info): (filename, font_info)
-                for filename, font_info in FONT_MAPPING.items()
-            }
-            
-            # Collect results
-            for future in concurrent.futures.as_completed(future_to_font):
-                filename, font_info = future_to_font[future]
-                try:
-                    success, path = future.result()
-                    if success and path:
-                        downloaded_fonts.append((path, font_info))
-                except Exception as e:
-                    self.log(f"Download failed for {filename}: {e}", "ERROR")
-        
-        self.log(f"Downloaded {len(downloaded_fonts)}/{len(FONT_MAPPING)} fonts", "SUCCESS")
+            for font_info, (success, path) in zip(infos, executor.map(self.download_font, filenames, infos)):
+                if success and path:
+                    downloaded_fonts.append((path, font_info))
+                    if on_complete is not None:
+                        on_complete((path, font_info))
+
+        self._save_etag_cache()
+        self.log("Downloaded %d/%d fonts", "SUCCESS", len(downloaded_fonts), len(FONT_MAPPING))
         return downloaded_fonts
     
     def rename_font_family(self, font: TTFont, family_name: str, subfamily: str) -> None:
         """Update font metadata with new family and subfamily names."""
-        if 'name' not in font:
-            return
-        
-        name_table = font['name']
-        
-        for record in name_table.names:
-            try:
-                if record.nameID == 1:  # Font Family name
-                    record.string = family_name.encode('utf-16be') if record.isUnicode() else family_name.encode('latin-1')
-                elif record.nameID == 2:  # Font Subfamily name
-                    record.string = subfamily.encode('utf-16be') if record.isUnicode() else subfamily.encode('latin-1')
-                elif record.nameID == 4:  # Full font name
-                    full_name = f"{family_name} {subfamily}"
-                    record.string = full_name.encode('utf-16be') if record.isUnicode() else full_name.encode('latin-1')
-                elif record.nameID == 6:  # PostScript name
-                    ps_name = family_name.replace(' ', '') + '-' + subfamily.replace(' ', '')
-                    record.string = ps_name.encode('utf-16be') if record.isUnicode() else ps_name.encode('latin-1')
-            except (UnicodeDecodeError, UnicodeEncodeError, AttributeError):
-                continue
+        _rename_font_family(font, family_name, subfamily)
     
-    def convert_font(self, font_path: Path, font_info: Dict) -> Optional[Path]:
-        """Convert a single WOFF2 font to TTF/OTF with proper naming."""
+    def convert_font(self, font_path: Path, font_info: Dict) -> Optional[Tuple[Path, TTFont]]:
+        """Convert a single WOFF2 font to TTF/OTF with proper naming.
+
+        Returns (output_path, font) so collection building can reuse the
+        already-parsed object instead of re-reading the file it just wrote.
+        """
         try:
-            # Load font
-            font = TTFont(str(font_path))
+            # Load font lazily: only the name table gets touched before save,
+            # so everything else streams through as raw bytes. Skipping the
+            # bbox/timestamp recalc avoids decompiling glyf just to save.
+            font = TTFont(str(font_path), lazy=True, recalcBBoxes=False, recalcTimestamp=False)
             font.flavor = None
-            
-            # Determine output extension
-            ext = ".otf"if "CFF "in font or "CFF2"in font else ".ttf"
+
+            # Determine output extension from the sfnt directory (no decompile)
+            tables = font.reader.tables if font.reader is not None else font
+            ext = ".otf"if "CFF "in tables or "CFF2"in tables else ".ttf"
             
             # Generate subfamily name
-            weight = font_info['weight']
-            style = font_info['style']
-            
-            subfamily_parts = []
-            if weight == 100:
-                subfamily_parts.append("Thin")
-            elif weight == 300:
-                subfamily_parts.append("Light")
-            elif weight == 700:
-                subfamily_parts.append("Bold")
-            elif weight == 900:
-                subfamily_parts.append("Black")
-            
-            if style == "italic":
-                subfamily_parts.append("Italic")
-            
-            subfamily = "".join(subfamily_parts) if subfamily_parts else "Regular"
+            subfamily = _SUBFAMILY.get((font_info['weight'], font_info['style']), "Regular")
             
-            # Update font metadata
-            self.rename_font_family(font, font_info['family'], subfamily)
-            
-            # Create family directory
-            family_dir = self.output_dir / font_info['family']
-            family_dir.mkdir(exist_ok=True)
-            
-            # Save converted font
+            # Save converted font (family dirs are pre-created by the caller)
             output_filename = font_info['output_name'] + ext
-            output_path = family_dir / output_filename
-            
+            output_path = self.output_dir / font_info['family'] / output_filename
+
+            # Rename immediately before save: 'name' is then the only table
+            # decompiled, everything else write-through as raw reader bytes
+            self.rename_font_family(font, font_info['family'], subfamily)
+            if self.collection_only:
+                # Font stays in memory; the collection pass writes the only
+                # bytes that reach disk
+                self.log("Prepared: %s -> %s/%s (in memory)", "CONVERT", font_path.name, font_info['family'], output_filename)
+                return output_path, font
             font.save(str(output_path))
-            
-            self.log(f"Converted: {font_path.name} -> {font_info['family']}/{output_filename}", "CONVERT")
-            return output_path
+
+            self.log("Converted: %s -> %s/%s", "CONVERT", font_path.name, font_info['family'], output_filename)
+            return output_path, font
             
         except Exception as e:
-            self.log(f"Error converting {font_path.name}: {e}", "ERROR")
+            self.log("Error converting %s: %s", "ERROR", font_path.name, e)
             return None
     
+    def _create_family_dirs(self, families) -> None:
+        """Pre-create output directories, one mkdir per distinct family."""
+        for family in set(families):
+            (self.output_dir / family).mkdir(parents=True, exist_ok=True)
+
     def convert_all_fonts(self, downloaded_fonts: List[Tuple[Path, Dict]], max_workers: int = 2) -> Dict[str, List[Path]]:
-        """Convert all fonts concurrently, organized by family."""
-        self.log(f"Converting {len(downloaded_fonts)} fonts...")
-        
+        """Convert all fonts concurrently, organized by family.
+
+        Conversion is CPU-bound (decompression + recompilation), so this
+        fans out to a process pool sized to the machine rather than the
+        I/O-oriented max_workers setting. Workers return bare paths;
+        create_font_collections reloads them lazily when bundling.
+        """
+        self.log("Converting %d fonts...", "INFO", len(downloaded_fonts))
+
+        # One mkdir per family up front instead of one per converted font
+        self._create_family_dirs(font_info['family'] for _, font_info in downloaded_fonts)
+
         converted_by_family = {}
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit conversion tasks
-            future_to_font = {
-                executor.submit(self.convert_font, font_path, font_info): (font_path, font_info)
-                for font_path, font_info in downloaded_fonts
-            }
-            
-            # Collect results
-            for future in concurrent.futures.as_completed(future_to_font):
-                font_path, font_info = future_to_font[future]
-                try:
-                    converted_path = future.result()
-                    if converted_path:
-                        family = font_info['family']
-                        if family not in converted_by_family:
-                            converted_by_family[family] = []
-                        converted_by_family[family].append(converted_path)
-                except Exception as e:
-                    self.log(f"Conversion failed for {font_path.name}: {e}", "ERROR")
-        
+
+        if self.collection_only:
+            # Fonts must stay in this process for the collection pass, so
+            # convert inline instead of shipping paths back from workers
+            for font_path, font_info in downloaded_fonts:
+                converted = self.convert_font(font_path, font_info)
+                if converted:
+                    converted_by_family.setdefault(font_info['family'], []).append(converted)
+            return converted_by_family
+
+        font_paths = [font_path for font_path, _ in downloaded_fonts]
+        infos = [font_info for _, font_info in downloaded_fonts]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # map + chunksize batches several fonts per IPC round trip and
+            # keeps inputs aligned with results, no future-to-key dict needed
+            results = executor.map(
+                _convert_font_worker,
+                (str(font_path) for font_path in font_paths),
+                infos,
+                itertools.repeat(str(self.output_dir)),
+                chunksize=2,
+            )
+            for font_path, font_info, converted_path in zip(font_paths, infos, results):
+                if converted_path:
+                    self.log("Converted: %s -> %s/%s", "CONVERT", font_path.name, font_info['family'], converted_path.name)
+                    family = font_info['family']
+                    if family not in converted_by_family:
+                        converted_by_family[family] = []
+                    converted_by_family[family].append(converted_path)
+                else:
+                    self.log("Error converting %s", "ERROR", font_path.name)
+
         return converted_by_family
     
-    def create_font_collections(self, converted_by_family: Dict[str, List[Path]]) -> List[Path]:
-        """Create TTC collection files for each font family."""
+    def download_and_convert(self, max_workers: int = 4) -> Dict[str, List[Tuple[Path, TTFont]]]:
+        """Run downloads and conversions as one streaming pipeline.
+
+        Downloaded files are handed to converter threads through a bounded
+        queue as they land, so conversion CPU overlaps network time and
+        end-to-end wall time approaches max(download, convert) instead of
+        their sum.
+        """
+        handoff: queue.Queue = queue.Queue(maxsize=2 * max_workers)
+        converted_by_family: Dict[str, List[Tuple[Path, TTFont]]] = {}
+        results_lock = threading.Lock()
+
+        # One mkdir per family up front instead of one per converted font
+        self._create_family_dirs(font_info['family'] for font_info in FONT_MAPPING.values())
+
+        def drain():
+            while True:
+                item = handoff.get()
+                if item is None:
+                    return
+                font_path, font_info = item
+                converted = self.convert_font(font_path, font_info)
+                if converted:
+                    with results_lock:
+                        converted_by_family.setdefault(font_info['family'], []).append(converted)
+
+        converter_count = max(1, min(2, max_workers))
+        converters = [threading.Thread(target=drain) for _ in range(converter_count)]
+        for thread in converters:
+            thread.start()
+
+        try:
+            self.download_all_fonts(max_workers, on_complete=handoff.put)
+        finally:
+            for _ in converters:
+                handoff.put(None)
+            for thread in converters:
+                thread.join()
+
+        return converted_by_family
+
+    def create_font_collections(self, converted_by_family: Dict) -> List[Path]:
+        """Create TTC collection files for each font family.
+
+        Family entries are either (path, TTFont) pairs from a conversion run
+        or bare Paths (collections-only mode); in-memory fonts are bundled
+        as-is, bare paths are loaded from disk.
+        """
         collections = []
-        
-        for family_name, font_paths in converted_by_family.items():
-            if len(font_paths) < 2:  # Skip single-font families
+
+        for family_name, font_entries in converted_by_family.items():
+            if len(font_entries) < 2:  # Skip single-font families
                 continue
-            
+
             try:
-                # Load all fonts in family
+                # Gather fonts, reusing parsed objects where we have them
                 family_fonts = []
-                for font_path in font_paths:
-                    family_fonts.append(TTFont(str(font_path)))
-                
-                # Create collection
+                for entry in font_entries:
+                    if isinstance(entry, tuple):
+                        family_fonts.append(entry[1])
+                    else:
+                        family_fonts.append(TTFont(str(entry), lazy=True))
+
+                # Create collection, storing shared metadata tables once
+                _share_identical_tables(family_fonts)
                 collection = TTCollection()
                 collection.fonts = family_fonts
                 
@@ -330,14 +715,14 @@ class FontProcessor:
                 collection.save(str(collection_path))
                 collections.append(collection_path)
                 
-                self.log(f"Created collection: {family_name}/{collection_name} ({len(family_fonts)} fonts)", "SUCCESS")
+                self.log("Created collection: %s/%s (%d fonts)", "SUCCESS", family_name, collection_name, len(family_fonts))
                 
             except Exception as e:
-                self.log(f"Failed to create collection for {family_name}: {e}", "ERROR")
+                self.log("Failed to create collection for %s: %s", "ERROR", family_name, e)
         
         return collections
     
-    def generate_report(self, converted_by_family: Dict[str, List[Path]], collections: List[Path]) -> None:
+    def generate_report(self, converted_by_family: Dict, collections: List[Path]) -> None:
         """Generate a comprehensive report of processed fonts."""
         print("\n"+ "="*60)
         print("🎨  FONT PROCESSING COMPLETE")
@@ -351,9 +736,10 @@ class FontProcessor:
         print()
         
         print("📁 FONT FAMILIES:")
-        for family_name, font_paths in converted_by_family.items():
-            print(f" 📂 {family_name} ({len(font_paths)} fonts)")
-            for font_path in sorted(font_paths):
+        for family_name, font_entries in converted_by_family.items():
+            print(f" 📂 {family_name} ({len(font_entries)} fonts)")
+            paths = [entry[0] if isinstance(entry, tuple) else entry for entry in font_entries]
+            for font_path in sorted(paths):
                 print(f"   • {font_path.name}")
             
             # Show collection if exists
@@ -422,8 +808,10 @@ Examples:
                        help="Clean output directory before processing")
     parser.add_argument("--skip-download", action="store_true", 
                        help="Skip download phase (use existing files)")
-    parser.add_argument("--collections-only", action="store_true", 
+    parser.add_argument("--collections-only", action="store_true",
                        help="Only create collections from existing fonts")
+    parser.add_argument("--collection-only-output", action="store_true",
+                       help="Write only the .ttc per family, no individual .ttf/.otf files")
     
     args = parser.parse_args()
     
@@ -436,7 +824,7 @@ Examples:
         shutil.rmtree(output_dir)
     
     # Initialize processor
-    processor = FontProcessor(args.base_url, downloads_dir, output_dir, args.verbose)
+    processor = FontProcessor(args.base_url, downloads_dir, output_dir, args.verbose, args.max_workers, args.collection_only_output)
     
     print("🚀 Starting  Font Manager")
     print(f"📥 Downloads: {downloads_dir}")
@@ -445,26 +833,24 @@ Examples:
     print()
     
     try:
-        # Phase 1: Download fonts
+        # Phase 1+2: Download and convert as a streaming pipeline
         if not args.skip_download and not args.collections_only:
-            downloaded_fonts = processor.download_all_fonts(args.max_workers)
-            if not downloaded_fonts:
-                print("❌ No fonts downloaded. Exiting.")
+            converted_by_family = processor.download_and_convert(args.max_workers)
+            if not converted_by_family:
+                print("❌ No fonts downloaded/converted. Exiting.")
                 return 1
-        else:
-            # Use existing downloads
+        elif not args.collections_only:
+            # Use existing downloads, then convert
             downloaded_fonts = []
             for filename, font_info in FONT_MAPPING.items():
                 font_path = downloads_dir / filename
                 if font_path.exists():
                     downloaded_fonts.append((font_path, font_info))
-            
+
             if not downloaded_fonts:
                 print(f"❌ No existing fonts found in {downloads_dir}. Use --skip-download=false")
                 return 1
-        
-        # Phase 2: Convert fonts
-        if not args.collections_only:
+
             converted_by_family = processor.convert_all_fonts(downloaded_fonts, args.max_workers)
             if not converted_by_family:
                 print("❌ No fonts converted. Exiting.")
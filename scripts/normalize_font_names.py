@@ -14,10 +14,12 @@ Notes:
 from __future__ import annotations
 
 import argparse
+from collections import Counter
 from pathlib import Path
 from typing import Optional, Tuple
 
 from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._n_a_m_e import NameRecord
 
 
 WINDOWS_PLATFORM_ID = 3
@@ -28,6 +30,10 @@ MAC_PLATFORM_ID = 1
 MAC_ENC_ID = 0
 MAC_LANG_ID = 0  # English
 
+# (platformID, platEncID, langID) triples for the two platforms we write
+WIN = (WINDOWS_PLATFORM_ID, WINDOWS_ENC_ID, WINDOWS_LANG_ID)
+MAC = (MAC_PLATFORM_ID, MAC_ENC_ID, MAC_LANG_ID)
+
 
 def is_italic(font: TTFont) -> bool:
     try:
@@ -109,11 +115,42 @@ def derive_style_name(font: TTFont) -> Tuple[str, str]:
     return human, ps
 
 
-def set_name(font: TTFont, name_id: int, value: str) -> None:
+def _make_record(string_bytes: bytes, name_id: int, platform_id: int, plat_enc_id: int, lang_id: int) -> NameRecord:
+    record = NameRecord()
+    record.nameID = name_id
+    record.platformID = platform_id
+    record.platEncID = plat_enc_id
+    record.langID = lang_id
+    record.string = string_bytes
+    return record
+
+
+def set_names(font: TTFont, values: dict[int, str]) -> None:
+    """Replace name records for all given IDs in one pass over the table."""
     name_table = font["name"]
-    # Set for Windows and Mac
-    name_table.setName(value, name_id, WINDOWS_PLATFORM_ID, WINDOWS_ENC_ID, WINDOWS_LANG_ID)
-    name_table.setName(value, name_id, MAC_PLATFORM_ID, MAC_ENC_ID, MAC_LANG_ID)
+    replaced = set(values)
+    # One sweep drops every record being rewritten, instead of rebuilding
+    # the list once per name ID. Match the exact WIN/MAC triples so records
+    # in other languages or encodings pass through untouched.
+    name_table.names = [
+        record for record in name_table.names
+        if not (record.nameID in replaced
+                and (record.platformID, record.platEncID, record.langID) in (WIN, MAC))
+    ]
+    for name_id, value in values.items():
+        # Encode once per value and build the records directly; setName
+        # would re-derive the encoding and scan for a match on every call
+        win_bytes = value.encode("utf-16-be")
+        try:
+            mac_bytes = value.encode("mac_roman")
+        except UnicodeEncodeError:
+            mac_bytes = value.encode("latin-1", errors="replace")
+        name_table.names.append(_make_record(win_bytes, name_id, *WIN))
+        name_table.names.append(_make_record(mac_bytes, name_id, *MAC))
+
+
+def set_name(font: TTFont, name_id: int, value: str) -> None:
+    set_names(font, {name_id: value})
 
 
 def determine_output_extension(font: TTFont) -> str:
@@ -122,39 +159,43 @@ def determine_output_extension(font: TTFont) -> str:
     return ".ttf"
 
 
-def normalize_one_font(src_path: Path, out_dir: Path, family_name: str, overwrite: bool, dry_run: bool, out_filename_override: Optional[str] = None) -> Tuple[bool, str, Optional[Path]]:
+def normalize_one_font(src_path: Path, out_dir: Path, family_name: str, overwrite: bool, dry_run: bool, out_filename_override: Optional[str] = None, font: Optional[TTFont] = None, precomputed: Optional[Tuple[str, str, str]] = None) -> Tuple[bool, str, Optional[Path]]:
     try:
-        font = TTFont(str(src_path))
-        ext = determine_output_extension(font)
+        # Reuse a caller-opened font when given; parsing dominates per-font
+        # cost, so reopening just to mutate names doubles the work
+        if font is None:
+            # Lazy load: only the name table is edited, the rest passes
+            # through untouched, and skipping recalc avoids decompiling glyf
+            font = TTFont(str(src_path), lazy=True, recalcBBoxes=False, recalcTimestamp=False)
+
+        # main() already derived these for filename planning; accept the
+        # (ext, style_human, style_ps) tuple rather than deriving twice
+        if precomputed is not None:
+            ext, style_human, style_ps = precomputed
+        else:
+            ext = determine_output_extension(font)
+            style_human, style_ps = derive_style_name(font)
 
         # Family names
         family_typographic = family_name
         family_menu = family_name
 
-        # Style names
-        style_human, style_ps = derive_style_name(font)
-
         full_name = f"{family_menu} {style_human}".strip()
         ps_family = family_menu.replace(" ", "")
         postscript_name = f"{ps_family}-{style_ps}".replace(" ", "")
 
-        # Update name IDs
-        # 1: Font Family name (menu family)
-        set_name(font, 1, family_menu)
-        # 2: Subfamily (style)
-        set_name(font, 2, style_human)
-        # 4: Full font name
-        set_name(font, 4, full_name)
-        # 6: PostScript name
-        set_name(font, 6, postscript_name)
-        # 16/17: Typographic Family/Subfamily if present
-        try:
-            set_name(font, 16, family_typographic)
-            set_name(font, 17, style_human)
-        except Exception:
-            pass
-        # 3: Unique font identifier (simple, not guaranteed globally unique)
-        set_name(font, 3, f"{postscript_name}")
+        # Update name IDs in a single pass over the name table:
+        # 1: family (menu), 2: subfamily, 3: unique ID, 4: full name,
+        # 6: PostScript name, 16/17: typographic family/subfamily
+        set_names(font, {
+            1: family_menu,
+            2: style_human,
+            3: postscript_name,
+            4: full_name,
+            6: postscript_name,
+            16: family_typographic,
+            17: style_human,
+        })
 
         out_filename = out_filename_override or f"{ps_family}-{style_ps}{ext}"
         out_path = out_dir / out_filename
@@ -165,7 +206,7 @@ def normalize_one_font(src_path: Path, out_dir: Path, family_name: str, overwrit
                 f"  Family: {family_menu}\n  Subfamily: {style_human}\n  Full: {full_name}\n  PS: {postscript_name}"
             ), out_path
 
-        out_dir.mkdir(parents=True, exist_ok=True)
+        # out_dir is pre-created by main(); per-font mkdir is redundant
         if out_path.exists() and not overwrite:
             return False, f"Skip (exists): {out_path}", out_path
 
@@ -203,27 +244,33 @@ def main(argv: list[str] | None = None) -> int:
     print(f"Output directory: {out_dir}")
     print(f"Target family: {args.family}")
 
+    if not args.dry_run:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
     successes = 0
     failures = 0
-    # Track planned filenames to avoid collisions
-    used_filenames: dict[str, int] = {}
+    ps_family = args.family.replace(" ", "")
+
+    # Single planning pass: open each font once, derive its style, and
+    # settle a unique output filename; Counter tracks collisions
+    seen: Counter[str] = Counter()
+    plans: list[tuple[Path, TTFont, str, str, str, str]] = []
     for path in candidates:
-        # Precompute intended filename to ensure uniqueness
-        font = TTFont(str(path))
+        font = TTFont(str(path), lazy=True, recalcBBoxes=False, recalcTimestamp=False)
         ext = determine_output_extension(font)
         style_human, style_ps = derive_style_name(font)
-        ps_family = args.family.replace(" ", "")
         base_filename = f"{ps_family}-{style_ps}{ext}"
+        seen[base_filename] += 1
         # De-duplicate filenames by appending incremental suffixes
-        if base_filename not in used_filenames:
-            used_filenames[base_filename] = 1
+        if seen[base_filename] == 1:
             out_filename = base_filename
         else:
-            used_filenames[base_filename] += 1
-            out_filename = f"{ps_family}-{style_ps}-{used_filenames[base_filename]}{ext}"
+            out_filename = f"{ps_family}-{style_ps}-{seen[base_filename]}{ext}"
+        plans.append((path, font, ext, style_human, style_ps, out_filename))
 
-        # Reopen within normalize call to ensure fresh object state
-        ok, msg, _ = normalize_one_font(path, out_dir, args.family, args.overwrite, args.dry_run, out_filename_override=out_filename)
+    # Dispatch pass: names are final, so each font is written exactly once
+    for path, font, ext, style_human, style_ps, out_filename in plans:
+        ok, msg, _ = normalize_one_font(path, out_dir, args.family, args.overwrite, args.dry_run, out_filename_override=out_filename, font=font, precomputed=(ext, style_human, style_ps))
         print(msg)
         if ok:
             successes += 1
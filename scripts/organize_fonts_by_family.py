@@ -4,31 +4,177 @@ Organize converted fonts into family-based folders with proper naming.
 """
 
 import argparse
+import concurrent.futures
+import functools
+import io
+import json
+import mmap
+import os
 import shutil
+import struct
 import sys
 from pathlib import Path
 from fontTools.ttLib import TTFont
+from fontTools.ttLib.ttCollection import TTCollection
+
+try:
+    # Linux-only; used for the reflink copy fast path
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Extensions we treat as installable fonts (constant-time membership)
+_FONT_EXT = frozenset({".ttf", ".otf"})
+
+# sfnt magics the direct binary reader understands
+_SFNT_MAGICS = (b"\x00\x01\x00\x00", b"OTTO", b"true")
+
+
+def _parse_name_table(mm, base: int):
+    """Pull name IDs 1 and 2 out of the sfnt directory at `base`.
+
+    Returns (family, subfamily) or None when there is no name table.
+    Windows records (3,1) win over Mac (1,0), en-US over other languages.
+    """
+    (num_tables,) = struct.unpack_from(">H", mm, base + 4)
+    name_offset = None
+    for i in range(num_tables):
+        tag, _checksum, offset, _length = struct.unpack_from(">4sIII", mm, base + 12 + 16 * i)
+        if tag == b"name":
+            name_offset = offset
+            break
+    if name_offset is None:
+        return None
+
+    _format, count, string_offset = struct.unpack_from(">HHH", mm, name_offset)
+    storage = name_offset + string_offset
+    best = {}  # name_id -> (rank, decoded string); lower rank wins
+    for i in range(count):
+        platform_id, enc_id, lang_id, name_id, length, offset = struct.unpack_from(
+            ">HHHHHH", mm, name_offset + 6 + 12 * i
+        )
+        if name_id not in (1, 2):
+            continue
+        data = bytes(mm[storage + offset:storage + offset + length])
+        if platform_id == 3 and enc_id == 1:
+            value = data.decode("utf-16-be", "replace")
+            rank = 0 if lang_id == 0x409 else 1
+        elif platform_id == 0:
+            value = data.decode("utf-16-be", "replace")
+            rank = 2
+        elif platform_id == 1 and enc_id == 0:
+            value = data.decode("mac_roman", "replace")
+            rank = 3
+        else:
+            continue
+        if name_id not in best or rank < best[name_id][0]:
+            best[name_id] = (rank, value)
+
+    family = best.get(1, (None, "Unknown"))[1]
+    subfamily = best.get(2, (None, "Regular"))[1]
+    return family, subfamily
+
+
+def _read_name_from_sfnt(font_path: Path):
+    """mmap the file and read the name table directly, skipping fontTools.
+
+    Returns (family, subfamily) or None when the fast path can't handle
+    the file (non-sfnt flavor, collection, truncated data).
+    """
+    try:
+        with open(font_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                magic = mm[:4]
+                if magic == b"ttcf":
+                    # Collection: subfonts share one family, so walk the
+                    # member offsets until one yields a name table
+                    (num_fonts,) = struct.unpack_from(">I", mm, 8)
+                    for i in range(num_fonts):
+                        (base,) = struct.unpack_from(">I", mm, 12 + 4 * i)
+                        info = _parse_name_table(mm, base)
+                        if info is not None:
+                            return info
+                    return None
+                if magic not in _SFNT_MAGICS:
+                    return None
+                return _parse_name_table(mm, 0)
+            finally:
+                mm.close()
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _decode_record(record) -> str:
+    """Decode a name record without toUnicode()'s per-call dispatch.
+
+    Windows records are UTF-16BE and Mac records mac_roman; decoding those
+    directly skips the platform/encoding lookup. Anything else (or a failed
+    decode) goes through toUnicode as before.
+    """
+    data = record.string
+    if isinstance(data, str):
+        return data
+    try:
+        if record.platformID == 3:
+            return data.decode("utf-16-be")
+        if record.platformID == 1:
+            return data.decode("mac_roman", "replace")
+    except UnicodeDecodeError:
+        pass
+    return record.toUnicode()
 
 
 def get_font_info(font_path: Path):
     """Extract font family and style information."""
+    # Fast path: two struct scans over an mmap instead of building a TTFont
+    info = _read_name_from_sfnt(font_path)
+    if info is not None:
+        return info
+
     try:
-        font = TTFont(str(font_path))
-        
+        # Only the name table is read, so defer decompiling everything else
+        # (glyf alone can take seconds on large fonts)
+        font = TTFont(str(font_path), lazy=True, ignoreDecompileErrors=True)
+
         family_name = "Unknown"
         subfamily_name = "Regular"
         
         if 'name' in font:
             name_table = font['name']
-            for record in name_table.names:
-                try:
-                    if record.nameID == 1:  # Font Family name
-                        family_name = record.toUnicode()
-                    elif record.nameID == 2:  # Font Subfamily name
-                        subfamily_name = record.toUnicode()
-                except:
-                    continue
-        
+            got_family = got_subfamily = False
+            # Two passes: Windows unicode (3,1) records first, then anything
+            # decodable. Checking the platform before decoding skips work
+            # for records we would discard anyway, and the break stops the
+            # scan once both IDs are resolved. One try outside the loop
+            # replaces the per-record handler: decodes almost never fail,
+            # so the common path pays no handler setup per iteration.
+            try:
+                for windows_only in (True, False):
+                    for record in name_table.names:
+                        name_id = record.nameID
+                        if name_id == 1 and not got_family:
+                            pass
+                        elif name_id == 2 and not got_subfamily:
+                            pass
+                        else:
+                            continue
+                        if windows_only and not (record.platformID == 3 and record.platEncID == 1):
+                            continue
+                        value = _decode_record(record)
+                        if name_id == 1:
+                            family_name, got_family = value, True
+                        else:
+                            subfamily_name, got_subfamily = value, True
+                        if got_family and got_subfamily:
+                            break
+                    if got_family and got_subfamily:
+                        break
+            except UnicodeDecodeError:
+                # Keep whatever resolved before the undecodable record
+                pass
+
         return family_name, subfamily_name
         
     except Exception as e:
@@ -36,8 +182,91 @@ def get_font_info(font_path: Path):
         return "Unknown", "Regular"
 
 
+# FICLONE ioctl: share extents with the source on reflink filesystems
+_FICLONE = 0x40049409
+
+# Files up to this size are copied as one mmap-backed write
+_SMALL_COPY_MAX = 4 * 1024 * 1024
+
+
+def _fastcopy(src: Path, dst: Path) -> None:
+    """Copy src to dst with the cheapest primitive the kernel offers.
+
+    Tries a reflink clone first (free on btrfs/xfs), then in-kernel
+    copy_file_range, then a plain userspace copy. Metadata is preserved
+    afterwards like shutil.copy2.
+    """
+    with open(src, "rb") as sf, open(dst, "wb") as df:
+        src_fd, dst_fd = sf.fileno(), df.fileno()
+
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                pass
+
+        try:
+            size = os.fstat(src_fd).st_size
+            if 0 < size <= _SMALL_COPY_MAX:
+                # Typical font sizes: hand the page cache one write call
+                # instead of looping through an intermediate buffer
+                mm = mmap.mmap(src_fd, 0, access=mmap.ACCESS_READ)
+                try:
+                    df.write(mm)
+                finally:
+                    mm.close()
+                shutil.copystat(src, dst)
+                return
+            copied = 0
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if n == 0:
+                    break
+                copied += n
+            if copied >= size:
+                shutil.copystat(src, dst)
+                return
+        except (AttributeError, OSError, ValueError):
+            pass
+
+        # Userspace fallback; rewind both ends in case a fast path wrote
+        # a partial prefix before failing
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+        shutil.copyfileobj(sf, df, length=1024 * 1024)
+    shutil.copystat(src, dst)
+
+
+def _copy_planned(item):
+    """Thread-pool copy worker: returns the message to log afterwards."""
+    font_path, new_path, family, new_filename = item
+    try:
+        _fastcopy(font_path, new_path)
+        return f"Organized: {font_path.name} -> {family}/{new_filename}"
+    except Exception as e:
+        return f"Error copying {font_path.name}: {e}"
+
+
+def _probe(path_str: str):
+    """Process-pool worker: read one font's family and subfamily.
+
+    Takes and returns plain strings so results pickle cheaply across the
+    process boundary.
+    """
+    family, subfamily = get_font_info(Path(path_str))
+    return path_str, family, subfamily
+
+
+@functools.lru_cache(maxsize=None)
 def generate_proper_filename(family: str, subfamily: str, extension: str) -> str:
-    """Generate a proper filename based on family and subfamily."""
+    """Generate a proper filename based on family and subfamily.
+
+    Memoized: fonts in one family repeat the same (family, subfamily,
+    extension) triples, and string arguments make caching safe.
+    """
     # Clean family name
     clean_family = family.replace(" ", "")
     
@@ -53,13 +282,16 @@ def generate_proper_filename(family: str, subfamily: str, extension: str) -> str
 def organize_fonts(source_dir: Path, output_dir: Path, overwrite: bool = False):
     """Organize fonts into family-based folders."""
     
-    # Find all font files
-    font_extensions = [".ttf", ".otf"]
-    font_files = []
-    
-    for ext in font_extensions:
-        font_files.extend(source_dir.glob(f"*{ext}"))
-    
+    # Find all font files in one directory pass; matching on the lowered
+    # suffix also picks up upper-case extensions like .TTF that glob missed
+    with os.scandir(source_dir) as entries:
+        font_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _FONT_EXT
+        ]
+    font_files.sort()
+
     if not font_files:
         print(f"No font files found in {source_dir}")
         return
@@ -68,44 +300,108 @@ def organize_fonts(source_dir: Path, output_dir: Path, overwrite: bool = False):
     print(f"Organizing into: {output_dir}")
     print()
     
-    # Group fonts by family
+    # Probe results survive across runs in a JSON sidecar keyed by
+    # path + mtime + size, so re-running on an unchanged directory costs
+    # one stat per font instead of a parse. "Unknown" results are cached
+    # too, so repeated failures don't re-parse either.
+    cache_path = output_dir / ".font_info_cache.json"
+    try:
+        cache = json.loads(cache_path.read_text())
+    except Exception:
+        cache = {}
+
+    # Group fonts by family. Parsing is CPU-bound and independent per file,
+    # so probe uncached fonts across a process pool; chunksize batches
+    # several paths per IPC round trip.
     families = {}
-    
+    uncached = []
+
     for font_path in font_files:
-        family, subfamily = get_font_info(font_path)
-        
-        if family not in families:
-            families[family] = []
-        
-        families[family].append((font_path, subfamily))
+        try:
+            st = font_path.stat()
+            key = f"{font_path}:{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            key = None
+        if key is not None and key in cache:
+            family, subfamily = cache[key]
+            if family not in families:
+                families[family] = []
+            families[family].append((font_path, subfamily))
+        else:
+            uncached.append((font_path, key))
+
+    if uncached:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_probe, [str(p) for p, _ in uncached], chunksize=8)
+            for (font_path, key), (_path_str, family, subfamily) in zip(uncached, results):
+                if key is not None:
+                    cache[key] = [family, subfamily]
+                if family not in families:
+                    families[family] = []
+
+                families[family].append((font_path, subfamily))
+
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache))
+    except Exception:
+        pass
     
-    # Create organized structure
+    # Create organized structure. Planning is split from execution: the
+    # first pass only computes (src, dst) pairs, the second submits the
+    # whole batch of copies, so the I/O runs back to back instead of
+    # interleaved with name generation and exists checks.
+    # Per-font messages are buffered and flushed in one write per family
+    # (and one per copy batch) instead of a syscall-per-line print
+    # Pre-create every family directory in one deduplicated pass; on
+    # network filesystems each mkdir is a round trip even when it exists
+    for family_dir in {output_dir / family for family in families}:
+        family_dir.mkdir(parents=True, exist_ok=True)
+
+    # Two source fonts can resolve to the same destination when they share
+    # (family, subfamily, extension); keying the plan by destination keeps
+    # the serial loop's last-wins behavior and stops two pool workers from
+    # truncating/writing the same file concurrently.
+    copy_plan = {}  # dst_path -> (src_path, family, new_filename); last wins
+    family_paths = {}  # family -> destination paths, for the collection step
+    msgs: list[str] = []
     for family, fonts in families.items():
-        # Create family directory
         family_dir = output_dir / family
-        family_dir.mkdir(parents=True, exist_ok=True)
-        
-        print(f"=== {family} Family ({len(fonts)} fonts) ===")
-        
+
+        msgs.append(f"=== {family} Family ({len(fonts)} fonts) ===")
+
         for font_path, subfamily in fonts:
             # Generate proper filename
             extension = font_path.suffix
             new_filename = generate_proper_filename(family, subfamily, extension)
             new_path = family_dir / new_filename
-            
+            paths = family_paths.setdefault(family, [])
+            if new_path not in paths:
+                paths.append(new_path)
+
             # Check if file exists
             if new_path.exists() and not overwrite:
-                print(f"Skip (exists): {new_filename}")
+                msgs.append(f"Skip (exists): {new_filename}")
                 continue
-            
-            # Copy font file
-            try:
-                shutil.copy2(font_path, new_path)
-                print(f"Organized: {font_path.name} -> {family}/{new_filename}")
-            except Exception as e:
-                print(f"Error copying {font_path.name}: {e}")
-        
-        print()
+
+            copy_plan[new_path] = (font_path, family, new_filename)
+
+        msgs.append("")
+        sys.stdout.write("\n".join(msgs) + "\n")
+        msgs.clear()
+
+    # Execute the planned copies as one batch. Destinations are unique and
+    # copies block in read/write where the GIL is released, so threads
+    # overlap the I/O stalls; logging stays out of the workers.
+    if copy_plan:
+        plan_items = [
+            (font_path, new_path, family, new_filename)
+            for new_path, (font_path, family, new_filename) in copy_plan.items()
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            msgs.extend(executor.map(_copy_planned, plan_items))
+        sys.stdout.write("\n".join(msgs) + "\n\n")
+        msgs.clear()
     
     print(f"✅ Organized fonts into {len(families)} family folders")
     
@@ -115,27 +411,43 @@ def organize_fonts(source_dir: Path, output_dir: Path, overwrite: bool = False):
     for family, fonts in families.items():
         if len(fonts) > 1:  # Only create collection if multiple fonts
             try:
-                from fontTools.ttLib.ttCollection import TTCollection
-                
-                # Load all fonts in family
-                family_fonts = []
                 family_dir = output_dir / family
-                
-                for font_file in family_dir.glob("*.[ot]tf"):
+                collection_name = family.replace(" ", "") + ".ttc"
+                collection_path = family_dir / collection_name
+
+                member_paths = [p for p in family_paths.get(family, []) if p.exists()]
+
+                # Reserializing the collection is the most expensive step;
+                # skip it when the .ttc already postdates every member
+                if member_paths and collection_path.exists() and not overwrite:
+                    newest = max(p.stat().st_mtime_ns for p in member_paths)
+                    if collection_path.stat().st_mtime_ns >= newest:
+                        print(f"Skip collection (up to date): {family}/{collection_name}")
+                        continue
+
+                # Load all fonts in family from the paths tracked during
+                # planning - no directory rescan, and stale files from
+                # earlier runs don't sneak into the collection. Lazy loads
+                # keep tables as raw reader bytes; TTCollection.save streams
+                # them through without a decompile/recompile cycle.
+                family_fonts = []
+                for font_file in member_paths:
                     try:
-                        family_fonts.append(TTFont(str(font_file)))
+                        family_fonts.append(TTFont(str(font_file), lazy=True))
                     except Exception as e:
                         print(f"Warning: Could not load {font_file.name}: {e}")
-                
+
                 if family_fonts:
                     # Create collection
                     collection = TTCollection()
                     collection.fonts = family_fonts
-                    
-                    collection_name = family.replace(" ", "") + ".ttc"
-                    collection_path = family_dir / collection_name
-                    
-                    collection.save(str(collection_path))
+
+                    # Serialize in memory, then hand the kernel one write:
+                    # save() otherwise issues a small write per table
+                    buf = io.BytesIO()
+                    collection.save(buf)
+                    with open(collection_path, "wb", buffering=0) as out_file:
+                        out_file.write(buf.getbuffer())
                     print(f"Created collection: {family}/{collection_name} ({len(family_fonts)} fonts)")
                 
             except Exception as e: